@@ -1,6 +1,5 @@
 import logging
-import re
-from functools import lru_cache
+import string
 
 import streamlit as st
 
@@ -8,24 +7,34 @@ from utils.argilla_dataset import ArgillaDatasetManager
 
 logger = logging.getLogger(__name__)
 
-AVAILABLE_DATASETS = {
-    "code_search_net",
-    "python_code_instructions",
-    "github_code_snippets",
-    "argilla_code_dataset",
-    "google/code_x_glue_ct_code_to_text",
-    "redashu/python_code_instructions",
+AVAILABLE_DATASETS = frozenset(
+    {
+        "code_search_net",
+        "python_code_instructions",
+        "github_code_snippets",
+        "argilla_code_dataset",
+        "google/code_x_glue_ct_code_to_text",
+        "redashu/python_code_instructions",
+    }
+)
+
+# Selectbox options, built once in a stable order instead of per rerun
+_DATASET_CHOICES = tuple(sorted(AVAILABLE_DATASETS))
+
+# Allow alphanumeric, underscores, hyphens, and forward slashes for org/repo
+# format. Every other ASCII character is deleted by the translate table, so a
+# valid name translates to itself.
+_DATASET_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-/")
+_DATASET_NAME_TABLE = {
+    code: None for code in range(128) if chr(code) not in _DATASET_NAME_CHARS
 }
 
 
-@lru_cache(maxsize=32)
 def validate_dataset_name(name: str) -> bool:
     if not name or not isinstance(name, str):
         logger.error(f"Invalid dataset name: {name}")
         return False
-    # Allow alphanumeric, underscores, hyphens, and forward slashes for org/repo format
-    pattern = r"^[a-zA-Z0-9_\-/]+$"
-    return bool(re.match(pattern, name))
+    return name.isascii() and name.translate(_DATASET_NAME_TABLE) == name
 
 
 def get_argilla_dataset_manager() -> ArgillaDatasetManager | None:
@@ -139,7 +148,7 @@ def dataset_browser() -> str | None:
                     st.warning("No Argilla datasets found")
                     return None
             else:
-                available_datasets = list(AVAILABLE_DATASETS)
+                available_datasets = _DATASET_CHOICES
 
             selected_dataset = st.selectbox("Select a dataset", available_datasets)
             if selected_dataset:
@@ -13,10 +13,9 @@ class CodeAnalyzerTool(AgentTool):
     score based on the total number of AST nodes.
 
     Attributes:
-        metadata (ToolMetadata): Metadata describing the tool, including
-            name, description, version, author, and tags.
+        metadata (ToolMetadata): Class-level metadata describing the tool,
+            including name, description, version, author, and tags.
     Methods:
-        __init__(): Initializes the tool and sets up metadata.
         validate_inputs(inputs: Dict[str, Any]) -> bool:
             Validates that the input dictionary contains a 'code' key
             with a string value.
@@ -36,15 +35,13 @@ class CodeAnalyzerTool(AgentTool):
                 RuntimeError: If code parsing or analysis fails.
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.metadata = ToolMetadata(
-            name="code_analyzer",
-            description="Analyzes Python code structure and complexity",
-            version="0.1.0",
-            author="CodeTuneStudio",
-            tags=["code-analysis", "python"],
-        )
+    metadata = ToolMetadata(
+        name="code_analyzer",
+        description="Analyzes Python code structure and complexity",
+        version="0.1.0",
+        author="CodeTuneStudio",
+        tags=["code-analysis", "python"],
+    )
 
     def validate_inputs(self, inputs: dict[str, Any]) -> bool:
         """Validate that required inputs are present"""
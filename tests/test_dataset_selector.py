@@ -0,0 +1,56 @@
+import unittest
+
+from components.dataset_selector import validate_dataset_name
+
+
+class TestValidateDatasetName(unittest.TestCase):
+    """
+    Unit tests for dataset name validation.
+    """
+
+    def test_valid_names(self) -> None:
+        """
+        Test that plain and org/repo names with allowed characters pass.
+        """
+        for name in (
+            "code_search_net",
+            "redashu/python_code_instructions",
+            "google/code_x_glue_ct_code_to_text",
+            "org-name/repo-2",
+        ):
+            with self.subTest(name=name):
+                assert validate_dataset_name(name)
+
+    def test_disallowed_ascii(self) -> None:
+        """
+        Test that ASCII characters outside the allowed set are rejected.
+        """
+        for name in ("my dataset", "data;rm", "org/repo.v2", "a\\b", "name$"):
+            with self.subTest(name=name):
+                assert not validate_dataset_name(name)
+
+    def test_non_ascii(self) -> None:
+        """
+        Test that non-ASCII letters and digits are rejected.
+        """
+        for name in ("datasét", "org/répo", "data\u0661"):
+            with self.subTest(name=name):
+                assert not validate_dataset_name(name)
+
+    def test_trailing_newline(self) -> None:
+        """
+        Test that a trailing newline is rejected, unlike the old ``$`` regex.
+        """
+        assert not validate_dataset_name("abc\n")
+
+    def test_empty_and_non_str(self) -> None:
+        """
+        Test that empty and non-string inputs are rejected.
+        """
+        for name in ("", None, 123, ["code_search_net"]):
+            with self.subTest(name=name):
+                assert not validate_dataset_name(name)
+
+
+if __name__ == "__main__":
+    unittest.main()
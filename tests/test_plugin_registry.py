@@ -0,0 +1,86 @@
+import unittest
+from typing import Any
+
+from plugins.code_analyzer import CodeAnalyzerTool
+from utils.plugins.base import AgentTool, ToolMetadata
+from utils.plugins.registry import PluginRegistry
+
+
+class ClassMetadataTool(AgentTool):
+    """Tool declaring metadata at class level; instantiating it must not happen"""
+
+    metadata = ToolMetadata(name="class_metadata_tool", description="stub")
+
+    def __init__(self) -> None:
+        msg = "register_tool must not instantiate class-metadata tools"
+        raise AssertionError(msg)
+
+    def execute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        return inputs
+
+    def validate_inputs(self, inputs: dict[str, Any]) -> bool:
+        return isinstance(inputs, dict)
+
+
+class InstanceMetadataTool(AgentTool):
+    """Tool setting metadata in __init__, like the OpenAI analyzer"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.metadata = ToolMetadata(name="instance_metadata_tool", description="stub")
+
+    def execute(self, inputs: dict[str, Any]) -> dict[str, Any]:
+        return inputs
+
+    def validate_inputs(self, inputs: dict[str, Any]) -> bool:
+        return isinstance(inputs, dict)
+
+
+class TestPluginRegistry(unittest.TestCase):
+    """
+    Unit tests for PluginRegistry.register_tool.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up an empty registry for each test.
+        """
+        self.registry = PluginRegistry()
+
+    def test_register_class_metadata_tool_without_instantiating(self) -> None:
+        """
+        Test that class-level metadata is read without calling __init__.
+        """
+        self.registry.register_tool(ClassMetadataTool)
+        assert self.registry.get_tool("class_metadata_tool") is ClassMetadataTool
+
+    def test_register_instance_metadata_tool(self) -> None:
+        """
+        Test that tools setting metadata in __init__ still register.
+        """
+        self.registry.register_tool(InstanceMetadataTool)
+        assert self.registry.get_tool("instance_metadata_tool") is InstanceMetadataTool
+
+    def test_register_both_tools(self) -> None:
+        """
+        Test that both metadata styles register side by side.
+        """
+        self.registry.register_tool(ClassMetadataTool)
+        self.registry.register_tool(InstanceMetadataTool)
+        assert self.registry.list_tools() == (
+            "class_metadata_tool",
+            "instance_metadata_tool",
+        )
+
+    def test_register_code_analyzer_from_class_metadata(self) -> None:
+        """
+        Test that the bundled code analyzer declares class-level metadata.
+        """
+        assert isinstance(CodeAnalyzerTool.metadata, ToolMetadata)
+        self.registry.register_tool(CodeAnalyzerTool)
+        name = CodeAnalyzerTool.metadata.name
+        assert self.registry.get_tool(name) is CodeAnalyzerTool
+
+
+if __name__ == "__main__":
+    unittest.main()
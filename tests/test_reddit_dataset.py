@@ -0,0 +1,152 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from datasets import Dataset
+
+from utils.reddit_dataset import RedditDatasetManager
+
+
+def _make_dataset() -> Dataset:
+    return Dataset.from_dict(
+        {
+            "text": [
+                "a perfectly valid post body",
+                "short",
+                "another valid post body here",
+                "          \n\t          ",
+                "a valid post with a low score",
+            ],
+            "score": [150, 500, 300, 400, 5],
+            "subreddit": ["python", "python", "learnpython", "python", "rust"],
+            "created_utc": [1000, 2000, 3000, 4000, 5000],
+        }
+    )
+
+
+class TestRedditDatasetManager(unittest.TestCase):
+    """
+    Unit tests for RedditDatasetManager filtering over Arrow-backed datasets.
+    """
+
+    def setUp(self) -> None:
+        """
+        Set up a manager whose cached dataset is a small in-memory dataset.
+        """
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.manager = RedditDatasetManager(cache_dir=self._tmp.name)
+        self.dataset = _make_dataset()
+        self.manager._dataset = self.dataset
+
+    def test_get_filtered_data_no_filters(self) -> None:
+        """
+        Test that every row is returned when no filter is given.
+        """
+        result = self.manager.get_filtered_data()
+        assert result["texts"] == self.dataset.with_format(None)[:]["text"]
+        assert result["metadata"]["score"].tolist() == [150, 500, 300, 400, 5]
+        assert result["metadata"]["subreddit"].tolist()[0] == "python"
+
+    def test_get_filtered_data_min_score(self) -> None:
+        """
+        Test that rows below the score threshold are dropped.
+        """
+        result = self.manager.get_filtered_data(min_score=200)
+        assert result["texts"] == [
+            "short",
+            "another valid post body here",
+            "          \n\t          ",
+        ]
+        assert result["metadata"]["score"].tolist() == [500, 300, 400]
+        assert result["metadata"]["created_utc"].tolist() == [2000, 3000, 4000]
+
+    def test_get_filtered_data_date_range(self) -> None:
+        """
+        Test filtering by an inclusive created_utc range combined with a score.
+        """
+        result = self.manager.get_filtered_data(
+            min_score=100, date_range=(2000, 4000), dataset=self.dataset
+        )
+        assert result["metadata"]["subreddit"].tolist() == [
+            "python",
+            "learnpython",
+            "python",
+        ]
+        assert len(result["texts"]) == 3
+
+    def test_get_filtered_data_no_matches(self) -> None:
+        """
+        Test that a filter matching nothing returns empty columns.
+        """
+        result = self.manager.get_filtered_data(min_score=10_000)
+        assert result["texts"] == []
+        assert len(result["metadata"]["score"]) == 0
+
+    def test_get_training_data(self) -> None:
+        """
+        Test that training data keeps only valid texts above the threshold.
+        """
+        texts = self.manager.get_training_data(min_score=100, include_amphigory=False)
+        assert texts == [
+            "a perfectly valid post body",
+            "another valid post body here",
+        ]
+
+    def test_get_training_data_max_samples(self) -> None:
+        """
+        Test that max_samples caps the number of returned texts.
+        """
+        texts = self.manager.get_training_data(
+            min_score=100, max_samples=1, include_amphigory=False
+        )
+        assert texts == ["a perfectly valid post body"]
+
+    @patch("datasets.load_dataset")
+    def test_load_falls_back_from_partial_snapshot(self, mock_load: MagicMock) -> None:
+        """
+        Test that an unreadable snapshot is replaced by a fresh Hub load.
+        """
+        (Path(self._tmp.name) / "reddit.arrow").mkdir()
+        mock_load.return_value = self.dataset
+        manager = RedditDatasetManager(cache_dir=self._tmp.name)
+
+        dataset = manager.load_reddit_updates_dataset()
+
+        assert dataset is not None
+        assert len(dataset) == len(self.dataset)
+        mock_load.assert_called_once()
+        assert sorted(os.listdir(self._tmp.name)) == ["reddit.arrow"]
+
+        # The rewritten snapshot is complete and is used by the next manager
+        reloaded = RedditDatasetManager(cache_dir=self._tmp.name)
+        assert len(reloaded.load_reddit_updates_dataset()) == len(self.dataset)
+        mock_load.assert_called_once()
+
+    def test_augment_with_amphigory_accepts_tuple(self) -> None:
+        """
+        Test that augmentation accepts any sequence and returns a list.
+        """
+        texts = tuple(f"sample text {i}" for i in range(20))
+        augmented = self.manager.augment_with_amphigory(texts, ratio=0.5)
+        assert isinstance(augmented, list)
+        assert len(augmented) == 30
+        assert sorted(set(augmented) & set(texts)) == sorted(texts)
+
+    def test_augment_with_amphigory_seed_is_reproducible(self) -> None:
+        """
+        Test that a seed fixes both the sampled templates and the shuffle.
+        """
+        texts = [f"sample text {i}" for i in range(50)]
+        first = self.manager.augment_with_amphigory(texts, ratio=0.2, seed=7)
+        second = self.manager.augment_with_amphigory(texts, ratio=0.2, seed=7)
+        assert first == second
+
+        training = self.manager.get_training_data(min_score=100, seed=7)
+        assert training == self.manager.get_training_data(min_score=100, seed=7)
+
+
+if __name__ == "__main__":
+    unittest.main()
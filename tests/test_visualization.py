@@ -0,0 +1,38 @@
+import unittest
+
+import numpy as np
+
+from utils.visualization import _MAX_CHART_POINTS, _downsample
+
+
+class TestDownsample(unittest.TestCase):
+    """
+    Unit tests for sampling long loss series before plotting.
+    """
+
+    def test_short_series_is_unchanged(self) -> None:
+        """
+        Test that a series at the threshold keeps Plotly's implicit index.
+        """
+        values = np.arange(_MAX_CHART_POINTS, dtype=np.float32)
+        steps, sampled = _downsample(values)
+        assert steps is None
+        assert sampled is values
+
+    def test_long_series_is_capped(self) -> None:
+        """
+        Test point count and end steps for series over the threshold.
+        """
+        for n in (_MAX_CHART_POINTS + 1, 3999, 123_457):
+            with self.subTest(n=n):
+                values = np.arange(n, dtype=np.float32)
+                steps, sampled = _downsample(values)
+                assert len(steps) == _MAX_CHART_POINTS
+                assert steps[0] == 0
+                assert steps[-1] == n - 1
+                assert np.all(np.diff(steps) > 0)
+                assert np.array_equal(sampled, values[steps])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -26,7 +26,13 @@ class ToolMetadata:
 
 
 class AgentTool(ABC):
-    """Base class for all agent tools"""
+    """
+    Base class for all agent tools
+
+    Subclasses may declare ``metadata`` as a class attribute holding a
+    ``ToolMetadata``; the registry then reads it without instantiating the
+    tool. Tools that set metadata in ``__init__`` are still supported.
+    """
 
     def __init__(self) -> None:
         self._metadata: ToolMetadata | None = None
@@ -1,15 +1,49 @@
 import importlib.util
 import inspect
 import logging
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
-from .base import AgentTool
+from utils.plugins.base import AgentTool, ToolMetadata
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Parent directories this module has inserted into sys.path
+_inserted_paths: set[str] = set()
+
+
+@lru_cache(maxsize=32)
+def _resolve_plugin_dir(plugin_dir: str) -> Path:
+    """
+    Resolve a plugin directory to its canonical path
+
+    Args:
+        plugin_dir: Absolute plugin directory path
+
+    Returns:
+        Resolved plugin directory path
+    """
+    return Path(plugin_dir).resolve()
+
+
+def _ensure_path_accessible(plugin_parent: str) -> None:
+    """
+    Make sure the plugin parent directory is importable
+
+    Args:
+        plugin_parent: Parent directory of the plugin directory
+    """
+    if plugin_parent in _inserted_paths:
+        return
+
+    if plugin_parent not in sys.path:
+        sys.path.insert(0, plugin_parent)
+    _inserted_paths.add(plugin_parent)
+
 
 class PluginRegistry:
     """Registry for managing agent tools"""
@@ -25,9 +59,12 @@ class PluginRegistry:
             tool_class: Tool class to register
         """
         try:
-            # Create temporary instance to get metadata
-            tool = tool_class()
-            tool_name = tool.metadata.name
+            # Prefer class-level metadata so registering does not run the
+            # tool's __init__; otherwise read it from a temporary instance
+            metadata = getattr(tool_class, "metadata", None)
+            if not isinstance(metadata, ToolMetadata):
+                metadata = tool_class().metadata
+            tool_name = metadata.name
 
             if tool_name in self._tools:
                 logger.warning(f"Tool {tool_name} already registered, updating...")
@@ -51,9 +88,9 @@ class PluginRegistry:
         """
         return self._tools.get(name)
 
-    def list_tools(self) -> list[str]:
-        """Get list of registered tool names"""
-        return list(self._tools.keys())
+    def list_tools(self) -> tuple[str, ...]:
+        """Get registered tool names in registration order"""
+        return tuple(self._tools)
 
     def clear_tools(self) -> None:
         """Clear all registered tools"""
@@ -68,53 +105,64 @@ class PluginRegistry:
             plugin_dir: Directory containing plugin files
         """
         try:
-            # Convert to absolute path
-            plugin_path = Path(plugin_dir).resolve()
+            # Convert to absolute path (cached per absolute path string)
+            plugin_path = _resolve_plugin_dir(os.path.abspath(plugin_dir))
             if not plugin_path.exists():
                 logger.warning(f"Plugin directory {plugin_dir} does not exist")
                 return
 
             # Add plugin directory to Python path if not already there
-            plugin_parent = str(plugin_path.parent)
-            if plugin_parent not in sys.path:
-                sys.path.insert(0, plugin_parent)
-
-            for file_path in plugin_path.glob("*.py"):
-                if file_path.name.startswith("__"):
-                    continue
-
-                try:
-                    # Import module using spec
-                    module_name = file_path.stem
-                    spec = importlib.util.spec_from_file_location(
-                        module_name, str(file_path)
-                    )
-
-                    if not spec or not spec.loader:
-                        logger.warning(f"Could not find spec for module: {module_name}")
-                        continue
+            _ensure_path_accessible(str(plugin_path.parent))
 
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-
-                    # Find and register tool classes
-                    for _name, obj in inspect.getmembers(module):
-                        if (
-                            inspect.isclass(obj)
-                            and issubclass(obj, AgentTool)
-                            and obj != AgentTool
-                        ):
-                            self.register_tool(obj)
+            with os.scandir(plugin_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("__") or not name.endswith(".py"):
+                        continue
+                    if not entry.is_file():
+                        continue
 
-                except Exception as e:
-                    logger.exception(f"Failed to load plugin {file_path}: {e!s}")
-                    logger.debug("Exception details:", exc_info=True)
+                    file_path = Path(entry.path)
+                    module_name = name[:-3]
+                    try:
+                        # Import module using spec
+                        spec = importlib.util.spec_from_file_location(
+                            module_name, str(file_path)
+                        )
+
+                        if not spec or not spec.loader:
+                            logger.warning(
+                                f"Could not find spec for module: {module_name}"
+                            )
+                            continue
+
+                        module = importlib.util.module_from_spec(spec)
+                        spec.loader.exec_module(module)
+
+                        # Find and register tool classes
+                        for _name, obj in inspect.getmembers(module):
+                            if (
+                                inspect.isclass(obj)
+                                and issubclass(obj, AgentTool)
+                                and obj != AgentTool
+                            ):
+                                self.register_tool(obj)
+
+                    except Exception as e:
+                        # Only pay for traceback formatting when debugging
+                        msg = f"Failed to load plugin {file_path}: {e!s}"
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.exception(msg)
+                        else:
+                            # Traceback deliberately omitted outside DEBUG
+                            logger.error(msg)  # noqa: TRY400
 
         except Exception as e:
             logger.exception(f"Error discovering plugins: {e!s}")
-            logger.debug("Exception details:", exc_info=True)
             raise
 
 
-# Global plugin registry instance
-registry = PluginRegistry()
+# Global plugin registry instance. If this file gets loaded under a second
+# module name, reuse the canonical singleton instead of creating another one.
+_canonical = sys.modules.get("utils.plugins.registry")
+registry: PluginRegistry = getattr(_canonical, "registry", None) or PluginRegistry()
@@ -1,12 +1,16 @@
 import logging
 import os
 import random
-from functools import lru_cache
-from typing import Any
+import shutil
+import tempfile
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-from datasets import load_dataset
-from tqdm import tqdm
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from datasets import Dataset
 
 # Configure logging with more detailed format
 logging.basicConfig(
@@ -14,6 +18,115 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Columns read from the Reddit dataset; everything else is dropped on load
+_REDDIT_COLUMNS = ["text", "score", "subreddit", "created_utc"]
+_METADATA_COLUMNS = ("score", "subreddit", "created_utc")
+
+# Length bounds for texts that pass quality control
+_MIN_TEXT_LENGTH = 10
+_MAX_TEXT_LENGTH = 50000
+
+# Nonsensical but syntactically valid code snippets, keyed by language
+_AMPHIGORY_TEMPLATES: dict[str, tuple[str, ...]] = {
+    "python": (
+        (
+            "def dance_with_bytes(rainbow_bits):\n"
+            "    return ''.join([chr((ord(b) << 2) >> 1) "
+            "for b in rainbow_bits])"
+        ),
+        (
+            "class QuantumPancake:\n"
+            "    def flip_in_time(self, syrup_waves):\n"
+            "        return float('inf') if syrup_waves else None"
+        ),
+        (
+            "async def dream_compiler(thoughts):\n"
+            "    return await sorted(thoughts, "
+            "key=lambda x: hash(str(x)))"
+        ),
+    ),
+    "javascript": (
+        (
+            "function whisperToPromises(dreamState) {\n"
+            "    return new Promise(resolve => "
+            "setTimeout(() => resolve(undefined ?? dreamState), "
+            "Infinity))}"
+        ),
+        (
+            "const floatingPixels = bytes => bytes.map(b => "
+            "typeof b === 'number' ? String.fromCharCode(b) : '🌈')"
+        ),
+        (
+            "class TimeTravel {\n"
+            "    static async rewind(memories) {\n"
+            "        return [...memories].reverse().filter(Boolean)}}"
+        ),
+    ),
+}
+
+# Flat pool across languages; templates are evenly split per language, so a
+# uniform draw matches picking a language first and then a template
+_AMPHIGORY_POOL: tuple[str, ...] = tuple(
+    template for templates in _AMPHIGORY_TEMPLATES.values() for template in templates
+)
+
+
+def _empty_filtered_data() -> dict[str, Any]:
+    """Empty result in the shape returned by ``get_filtered_data``"""
+    return {
+        "texts": [],
+        "metadata": {
+            "score": np.empty(0, dtype=np.int64),
+            "subreddit": np.empty(0, dtype=object),
+            "created_utc": np.empty(0, dtype=np.int64),
+        },
+    }
+
+
+def _read_columns(dataset: "Dataset") -> dict[str, np.ndarray]:
+    """Read the Reddit metadata columns out of Arrow as struct-of-arrays"""
+    if len(dataset) == 0:
+        return _empty_filtered_data()["metadata"]
+
+    # Slice with [:] so every datasets release materializes the columns;
+    # plain column access returns a lazy Column object on datasets 4.x
+    numeric = dataset.with_format("numpy", columns=["score", "created_utc"])[:]
+    subreddits = dataset.with_format(None, columns=["subreddit"])[:]["subreddit"]
+    return {
+        "score": numeric["score"],
+        "subreddit": np.asarray(subreddits, dtype=object),
+        "created_utc": numeric["created_utc"],
+    }
+
+
+def _read_texts(dataset: "Dataset") -> list[str]:
+    """Decode the ``text`` column of a dataset into a list of strings"""
+    return dataset.with_format(None, columns=["text"])[:]["text"]
+
+
+def _save_snapshot(dataset: "Dataset", snapshot_dir: str) -> None:
+    """
+    Save a dataset snapshot so readers never see a partially written one
+
+    The snapshot is written to a temporary sibling directory and renamed into
+    place, so ``snapshot_dir`` either does not exist or holds a complete save.
+
+    Args:
+        dataset: Dataset to snapshot
+        snapshot_dir: Final snapshot directory
+    """
+    tmp_dir = tempfile.mkdtemp(
+        prefix=f".{os.path.basename(snapshot_dir)}-",
+        dir=os.path.dirname(snapshot_dir),
+    )
+    try:
+        dataset.save_to_disk(tmp_dir)
+        os.replace(tmp_dir, snapshot_dir)
+    except Exception as e:
+        logger.warning(f"Could not snapshot Reddit dataset: {e!s}")
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
 
 class RedditDatasetManager:
     """Handle Reddit dataset operations.
@@ -34,6 +147,8 @@ class RedditDatasetManager:
         self.cache_dir = cache_dir or os.path.join(os.getcwd(), "dataset_cache")
         self.max_cache_size = max_cache_size
         os.makedirs(self.cache_dir, exist_ok=True)
+        self._dataset: Dataset | None = None
+        self._columns: dict[str, np.ndarray] | None = None
         logger.info(f"Initialized RedditDatasetManager with cache at {self.cache_dir}")
 
     def validate_text(self, text: str) -> bool:
@@ -49,17 +164,13 @@ class RedditDatasetManager:
         if not isinstance(text, str):
             return False
 
-        # Basic quality checks
-        min_length = 10
-        max_length = 50000
+        # Cheap length bounds first; isspace() then stops at the first
+        # non-whitespace character without copying the text
         text_length = len(text)
+        if text_length < _MIN_TEXT_LENGTH or text_length > _MAX_TEXT_LENGTH:
+            return False
 
-        return (
-            text_length >= min_length
-            and text_length <= max_length
-            and text.strip() != ""
-            and not text.isspace()
-        )
+        return not text.isspace()
 
     def generate_amphigory_code(self, language: str) -> str:
         """
@@ -71,56 +182,21 @@ class RedditDatasetManager:
         Returns:
             Generated code snippet
         """
-        templates = {
-            "python": [
-                (
-                    "def dance_with_bytes(rainbow_bits):\n"
-                    "    return ''.join([chr((ord(b) << 2) >> 1) "
-                    "for b in rainbow_bits])"
-                ),
-                (
-                    "class QuantumPancake:\n"
-                    "    def flip_in_time(self, syrup_waves):\n"
-                    "        return float('inf') if syrup_waves else None"
-                ),
-                (
-                    "async def dream_compiler(thoughts):\n"
-                    "    return await sorted(thoughts, "
-                    "key=lambda x: hash(str(x)))"
-                ),
-            ],
-            "javascript": [
-                (
-                    "function whisperToPromises(dreamState) {\n"
-                    "    return new Promise(resolve => "
-                    "setTimeout(() => resolve(undefined ?? dreamState), "
-                    "Infinity))}"
-                ),
-                (
-                    "const floatingPixels = bytes => bytes.map(b => "
-                    "typeof b === 'number' ? String.fromCharCode(b) : '🌈')"
-                ),
-                (
-                    "class TimeTravel {\n"
-                    "    static async rewind(memories) {\n"
-                    "        return [...memories].reverse().filter(Boolean)}}"
-                ),
-            ],
-        }
-
-        available_templates = templates.get(language.lower(), templates["python"])
+        available_templates = _AMPHIGORY_TEMPLATES.get(
+            language.lower(), _AMPHIGORY_TEMPLATES["python"]
+        )
         return random.choice(available_templates)
 
-    @lru_cache(maxsize=128)
     def augment_with_amphigory(
-        self, texts: tuple[str, ...], ratio: float = 0.1
+        self, texts: "Sequence[str]", ratio: float = 0.1, seed: int | None = None
     ) -> list[str]:
         """
         Augment dataset with nonsensical but syntactically valid code
 
         Args:
-            texts: Tuple of text samples (converted from list for caching)
+            texts: Sequence of text samples
             ratio: Ratio of amphigory samples to add
+            seed: Optional seed making the sampling and shuffle reproducible
 
         Returns:
             Augmented list of texts
@@ -129,19 +205,18 @@ class RedditDatasetManager:
             msg = "Ratio must be between 0 and 1"
             raise ValueError(msg)
 
-        augmented_texts = list(texts)
         num_amphigory = int(len(texts) * ratio)
 
         logger.info(f"Generating {num_amphigory} amphigory samples")
 
-        languages = ["python", "javascript"]
-        for _ in range(num_amphigory):
-            language = random.choice(languages)
-            amphigory = self.generate_amphigory_code(language)
-            augmented_texts.append(amphigory)
+        # Draw every sample index in one vectorized call, then shuffle
+        # through a compiled index permutation from the same generator
+        rng = np.random.default_rng(seed)
+        picks = rng.integers(0, len(_AMPHIGORY_POOL), size=num_amphigory)
+        augmented_texts = [*texts, *(_AMPHIGORY_POOL[i] for i in picks.tolist())]
 
-        random.shuffle(augmented_texts)
-        return augmented_texts
+        order = rng.permutation(len(augmented_texts))
+        return [augmented_texts[i] for i in order.tolist()]
 
     def get_training_data(
         self,
@@ -149,6 +224,7 @@ class RedditDatasetManager:
         max_samples: int | None = None,
         include_amphigory: bool = True,
         amphigory_ratio: float = 0.1,
+        seed: int | None = None,
     ) -> list[str]:
         """
         Get processed data ready for model training with enhanced filtering
@@ -158,6 +234,7 @@ class RedditDatasetManager:
             max_samples: Maximum number of samples to return
             include_amphigory: Whether to include nonsensical code examples
             amphigory_ratio: Ratio of amphigory samples to add
+            seed: Optional seed for reproducible amphigory augmentation
 
         Returns:
             List of processed text samples
@@ -173,8 +250,7 @@ class RedditDatasetManager:
                 texts = texts[:max_samples]
 
             if include_amphigory:
-                # Convert to tuple for caching
-                texts = self.augment_with_amphigory(tuple(texts), amphigory_ratio)
+                texts = self.augment_with_amphigory(texts, amphigory_ratio, seed)
 
             logger.info(f"Prepared {len(texts)} samples for training")
             return texts
@@ -183,88 +259,123 @@ class RedditDatasetManager:
             logger.exception(f"Error preparing training data: {e!s}")
             return []
 
-    def load_reddit_updates_dataset(self) -> dict[str, Any] | None:
+    def load_reddit_updates_dataset(self) -> "Dataset | None":
         """
-        Load and process the Reddit dataset with batched processing
+        Load the Reddit dataset as an Arrow-backed ``Dataset``
+
+        Rows are left in Arrow storage so that filtering can run over whole
+        columns instead of decoding every record into Python objects. The
+        dataset is kept on the instance and snapshotted under ``cache_dir`` so
+        later calls and later processes skip the Hub load.
 
         Returns:
-            Processed dataset dictionary or None if loading fails
+            Loaded dataset or None if loading fails
         """
-        try:
-            logger.info("Loading Reddit BestOfRedditorUpdates dataset")
-            dataset = load_dataset(
-                "reddit-tools-HF/dataset-creator-reddit-bestofredditorupdates",
-                cache_dir=self.cache_dir,
-                split="train",
-            )
-
-            processed_data = {"texts": [], "metadata": []}
-
-            # Process in batches for better memory efficiency
-            batch_size = 1000
-            for i in tqdm(range(0, len(dataset), batch_size)):
-                batch = dataset[i : i + batch_size]
+        if self._dataset is not None:
+            return self._dataset
 
-                processed_data["texts"].extend([item.get("text", "") for item in batch])
-                processed_data["metadata"].extend(
-                    [
-                        {
-                            "score": item.get("score"),
-                            "subreddit": item.get("subreddit"),
-                            "created_utc": item.get("created_utc"),
-                        }
-                        for item in batch
-                    ]
-                )
-
-            logger.info(f"Successfully loaded {len(processed_data['texts'])} records")
-            return processed_data
+        try:
+            # Imported lazily: datasets pulls in pyarrow, fsspec and the Hub
+            # client, which most importers of this module never need
+            from datasets import load_dataset, load_from_disk
+
+            snapshot_dir = os.path.join(self.cache_dir, "reddit.arrow")
+            dataset = None
+            if os.path.isdir(snapshot_dir):
+                logger.info(f"Loading Reddit dataset snapshot from {snapshot_dir}")
+                try:
+                    dataset = load_from_disk(snapshot_dir)
+                except Exception as e:
+                    logger.warning(f"Discarding unreadable Reddit snapshot: {e!s}")
+                    shutil.rmtree(snapshot_dir, ignore_errors=True)
+
+            if dataset is None:
+                logger.info("Loading Reddit BestOfRedditorUpdates dataset")
+                dataset = load_dataset(
+                    "reddit-tools-HF/dataset-creator-reddit-bestofredditorupdates",
+                    cache_dir=self.cache_dir,
+                    split="train",
+                ).select_columns(_REDDIT_COLUMNS)
+                _save_snapshot(dataset, snapshot_dir)
+
+            self._dataset = dataset
+            logger.info(f"Successfully loaded {len(dataset)} records")
+            return dataset
 
         except Exception as e:
             logger.exception(f"Failed to load Reddit dataset: {e!s}")
             return None
 
+    def _get_columns(self, dataset: "Dataset") -> dict[str, np.ndarray]:
+        """
+        Get the cached struct-of-arrays metadata columns of the Reddit dataset
+
+        Args:
+            dataset: The instance's loaded Reddit dataset
+
+        Returns:
+            Metadata column arrays keyed by name
+        """
+        if self._columns is None:
+            self._columns = _read_columns(dataset)
+        return self._columns
+
     def get_filtered_data(
-        self, min_score: int | None = None, date_range: tuple[int, int] | None = None
-    ) -> dict[str, list]:
+        self,
+        min_score: int | None = None,
+        date_range: tuple[int, int] | None = None,
+        dataset: "Dataset | None" = None,
+    ) -> dict[str, Any]:
         """
         Get filtered dataset with improved validation
 
         Args:
             min_score: Minimum score threshold for posts
             date_range: Tuple of (start_date, end_date) in UTC timestamp format
+            dataset: Optional pre-loaded dataset to filter instead of the
+                cached Reddit dataset
 
         Returns:
-            Filtered dataset dictionary
+            Filtered dataset dictionary with a ``texts`` list and a columnar
+            ``metadata`` dict of NumPy arrays keyed by ``score``,
+            ``subreddit`` and ``created_utc``
         """
         try:
-            data = self.load_reddit_updates_dataset()
-            if not data:
-                return {"texts": [], "metadata": []}
-
-            filtered_texts = []
-            filtered_metadata = []
-
-            # Use numpy for faster filtering
-            scores = np.array([meta["score"] for meta in data["metadata"]])
-            dates = np.array([meta["created_utc"] for meta in data["metadata"]])
+            own_dataset = dataset is None
+            if own_dataset:
+                dataset = self.load_reddit_updates_dataset()
+            if dataset is None:
+                return _empty_filtered_data()
+
+            # Metadata columns of the instance's own dataset are read out of
+            # Arrow once and reused; filtering only builds masks and copies
+            columns = (
+                self._get_columns(dataset) if own_dataset else _read_columns(dataset)
+            )
 
+            scores = columns["score"]
             mask = np.ones(len(scores), dtype=bool)
             if min_score is not None:
                 mask &= scores >= min_score
 
             if date_range:
                 start_date, end_date = date_range
+                dates = columns["created_utc"]
                 mask &= (dates >= start_date) & (dates <= end_date)
 
-            filtered_indices = np.where(mask)[0]
-
-            filtered_texts = [data["texts"][i] for i in filtered_indices]
-            filtered_metadata = [data["metadata"][i] for i in filtered_indices]
+            # Texts stay in Arrow until the mask is known, so only kept rows
+            # are ever decoded into Python strings
+            if mask.all():
+                filtered_texts = _read_texts(dataset)
+            else:
+                filtered_texts = _read_texts(dataset.select(np.flatnonzero(mask)))
+            filtered_metadata = {
+                name: columns[name][mask] for name in _METADATA_COLUMNS
+            }
 
             logger.info(f"Filtered dataset contains {len(filtered_texts)} records")
             return {"texts": filtered_texts, "metadata": filtered_metadata}
 
         except Exception as e:
             logger.exception(f"Error filtering dataset: {e!s}")
-            return {"texts": [], "metadata": []}
+            return _empty_filtered_data()